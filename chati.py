@@ -1,9 +1,10 @@
 # ============================================================================
 # 1. CORE/ENTITIES/persona.py - Entidad de Dominio
 # ============================================================================
+import msgspec
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional, Union
 
 @dataclass
 class Persona:
@@ -14,8 +15,9 @@ class Persona:
     email: str
     edad: int
     telefono: Optional[str]
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
+    # Se guardan tal como llegan de la BD (ISO string), sin parsear
+    created_at: Optional[Union[str, datetime]] = None
+    updated_at: Optional[Union[str, datetime]] = None
     
     def nombre_completo(self) -> str:
         """Método de dominio"""
@@ -26,12 +28,29 @@ class Persona:
         return self.edad >= 18
 
 
+class PersonaRead(msgspec.Struct, frozen=True):
+    """Modelo de lectura de Persona (msgspec), tal como llega de la BD"""
+    id: Union[int, str]
+    nombre: str
+    apellido: str
+    email: str
+    edad: int
+    telefono: Optional[str]
+    created_at: str
+    updated_at: Optional[str] = None
+    
+    @classmethod
+    def from_db_row(cls, row: Dict[str, Any]) -> "PersonaRead":
+        """Construye el modelo de lectura desde un registro de la BD"""
+        return msgspec.convert(row, cls)
+
+
 # ============================================================================
 # 2. CORE/INTERFACES/REPOSITORIES/persona_repository.py - Port (Interface)
 # ============================================================================
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from src.core.entities.persona import Persona
+from typing import Any, Dict, List, Optional
+from src.core.entities.persona import Persona, PersonaRead
 
 class PersonaRepositoryInterface(ABC):
     """Port - Define el contrato para el repositorio"""
@@ -41,15 +60,15 @@ class PersonaRepositoryInterface(ABC):
         pass
     
     @abstractmethod
-    async def get_by_id(self, persona_id: str) -> Optional[Persona]:
+    async def get_by_id(self, persona_id: str) -> Optional[PersonaRead]:
         pass
     
     @abstractmethod
-    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Persona]:
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[PersonaRead]:
         pass
     
     @abstractmethod
-    async def update(self, persona_id: str, persona: Persona) -> Optional[Persona]:
+    async def update(self, persona_id: str, data: Dict[str, Any]) -> Optional[Persona]:
         pass
     
     @abstractmethod
@@ -57,22 +76,30 @@ class PersonaRepositoryInterface(ABC):
         pass
     
     @abstractmethod
-    async def get_by_email(self, email: str) -> Optional[Persona]:
+    async def get_by_email(self, email: str) -> Optional[PersonaRead]:
         pass
 
 
 # ============================================================================
 # 3. APPLICATION/DTOS/persona_dto.py - Data Transfer Objects
 # ============================================================================
-from pydantic import BaseModel, EmailStr, Field
-from typing import Optional
+import msgspec
+from pydantic.config import ConfigDict
+from pydantic.fields import Field
+from pydantic.main import BaseModel
+from pydantic.types import StringConstraints
+from typing import Annotated, Optional
 from datetime import datetime
 
+# Validación sintáctica simple; la unicidad la garantiza el índice de la BD
+EMAIL_RE = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+EmailField = Annotated[str, StringConstraints(min_length=3, max_length=254, pattern=EMAIL_RE)]
+
 class PersonaCreateDTO(BaseModel):
     """DTO para crear una persona"""
     nombre: str = Field(..., min_length=2, max_length=100)
     apellido: str = Field(..., min_length=2, max_length=100)
-    email: EmailStr
+    email: EmailField
     edad: int = Field(..., ge=0, le=150)
     telefono: Optional[str] = Field(None, max_length=20)
 
@@ -80,7 +107,7 @@ class PersonaUpdateDTO(BaseModel):
     """DTO para actualizar una persona"""
     nombre: Optional[str] = Field(None, min_length=2, max_length=100)
     apellido: Optional[str] = Field(None, min_length=2, max_length=100)
-    email: Optional[EmailStr] = None
+    email: Optional[EmailField] = None
     edad: Optional[int] = Field(None, ge=0, le=150)
     telefono: Optional[str] = Field(None, max_length=20)
 
@@ -95,15 +122,17 @@ class PersonaResponseDTO(BaseModel):
     created_at: datetime
     updated_at: Optional[datetime]
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+PERSONA_ENCODER = msgspec.json.Encoder()
+
 
 
 # ============================================================================
 # 4. APPLICATION/USE_CASES/persona/create_persona.py - Caso de Uso
 # ============================================================================
 from src.core.interfaces.repositories.persona_repository import PersonaRepositoryInterface
-from src.core.entities.persona import Persona
+from src.core.entities.persona import Persona, PersonaRead
 from src.application.dtos.persona_dto import PersonaCreateDTO, PersonaResponseDTO
 
 class CreatePersonaUseCase:
@@ -144,12 +173,12 @@ class GetPersonaUseCase:
     def __init__(self, repository: PersonaRepositoryInterface):
         self.repository = repository
     
-    async def execute(self, persona_id: str) -> PersonaResponseDTO:
+    async def execute(self, persona_id: str) -> PersonaRead:
         persona = await self.repository.get_by_id(persona_id)
         if not persona:
             raise ValueError(f"Persona con ID {persona_id} no encontrada")
         
-        return PersonaResponseDTO.model_validate(persona)
+        return persona
 
 
 # ============================================================================
@@ -163,9 +192,8 @@ class ListPersonasUseCase:
     def __init__(self, repository: PersonaRepositoryInterface):
         self.repository = repository
     
-    async def execute(self, skip: int = 0, limit: int = 100) -> List[PersonaResponseDTO]:
-        personas = await self.repository.get_all(skip=skip, limit=limit)
-        return [PersonaResponseDTO.model_validate(p) for p in personas]
+    async def execute(self, skip: int = 0, limit: int = 100) -> List[PersonaRead]:
+        return await self.repository.get_all(skip=skip, limit=limit)
 
 
 # ============================================================================
@@ -178,25 +206,21 @@ class UpdatePersonaUseCase:
         self.repository = repository
     
     async def execute(self, persona_id: str, data: PersonaUpdateDTO) -> PersonaResponseDTO:
-        # Verificar que existe
-        existing = await self.repository.get_by_id(persona_id)
-        if not existing:
-            raise ValueError(f"Persona con ID {persona_id} no encontrada")
-        
         # Actualizar solo los campos proporcionados
         updated_data = data.model_dump(exclude_unset=True)
         
-        # Crear entidad actualizada
-        persona = Persona(
-            id=persona_id,
-            nombre=updated_data.get('nombre', existing.nombre),
-            apellido=updated_data.get('apellido', existing.apellido),
-            email=updated_data.get('email', existing.email),
-            edad=updated_data.get('edad', existing.edad),
-            telefono=updated_data.get('telefono', existing.telefono)
-        )
+        # Sin cambios: no se escribe nada, solo se devuelve el registro actual
+        if not updated_data:
+            existing = await self.repository.get_by_id(persona_id)
+            if not existing:
+                raise ValueError(f"Persona con ID {persona_id} no encontrada")
+            return PersonaResponseDTO.model_validate(existing)
+        
+        # Una sola llamada: si no hay filas afectadas la persona no existe
+        updated = await self.repository.update(persona_id, updated_data)
+        if not updated:
+            raise ValueError(f"Persona con ID {persona_id} no encontrada")
         
-        updated = await self.repository.update(persona_id, persona)
         return PersonaResponseDTO.model_validate(updated)
 
 
@@ -210,30 +234,64 @@ class DeletePersonaUseCase:
         self.repository = repository
     
     async def execute(self, persona_id: str) -> bool:
-        # Verificar que existe
-        existing = await self.repository.get_by_id(persona_id)
-        if not existing:
+        # Una sola llamada: si no hay filas borradas la persona no existe
+        deleted = await self.repository.delete(persona_id)
+        if not deleted:
             raise ValueError(f"Persona con ID {persona_id} no encontrada")
         
-        return await self.repository.delete(persona_id)
+        return deleted
 
 
 # ============================================================================
 # 9. INFRASTRUCTURE/DATABASE/REPOSITORIES/supabase_persona_repository.py
 # ============================================================================
-from typing import List, Optional
+import asyncio
+import httpx
+import msgspec
+from typing import Any, Dict, List, Optional
+from postgrest.exceptions import APIError
 from supabase import Client
 from src.core.interfaces.repositories.persona_repository import PersonaRepositoryInterface
-from src.core.entities.persona import Persona
-from datetime import datetime
+from src.core.entities.persona import Persona, PersonaRead
+
+# Decodifica el body de PostgREST directamente a structs, sin dicts intermedios
+_PERSONA_LIST_DECODER = msgspec.json.Decoder(List[PersonaRead])
 
 class SupabasePersonaRepository(PersonaRepositoryInterface):
-    """Adaptador concreto para Supabase"""
+    """Adaptador concreto para Supabase
+
+    El cliente de supabase-py es síncrono: todos los `.execute()` pasan por
+    `_run`, que los ejecuta en el threadpool para no bloquear el event loop.
+    """
     
     def __init__(self, supabase_client: Client):
         self.client = supabase_client
         self.table = "personas"
     
+    async def _run(self, query):
+        """Ejecuta el query síncrono de supabase-py en el threadpool"""
+        return await asyncio.to_thread(query.execute)
+    
+    async def _get_raw(self, params: Dict[str, Any]) -> bytes:
+        """GET directo a PostgREST que devuelve el body sin parsear.
+
+        Los errores se elevan como `APIError`, igual que en `_run`.
+        """
+        response = await asyncio.to_thread(
+            self.client.postgrest.session.get, f"/{self.table}", params=params
+        )
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError:
+            try:
+                error = response.json()
+            except ValueError:
+                error = None
+            if not isinstance(error, dict):
+                error = {"message": response.text}
+            raise APIError(error)
+        return response.content
+    
     async def create(self, persona: Persona) -> Persona:
         data = {
             "nombre": persona.nombre,
@@ -243,31 +301,23 @@ class SupabasePersonaRepository(PersonaRepositoryInterface):
             "telefono": persona.telefono
         }
         
-        result = self.client.table(self.table).insert(data).execute()
+        result = await self._run(self.client.table(self.table).insert(data))
         return self._to_entity(result.data[0])
     
-    async def get_by_id(self, persona_id: str) -> Optional[Persona]:
-        result = self.client.table(self.table).select("*").eq("id", persona_id).execute()
+    async def get_by_id(self, persona_id: str) -> Optional[PersonaRead]:
+        result = await self._run(self.client.table(self.table).select("*").eq("id", persona_id))
         
         if not result.data:
             return None
         
-        return self._to_entity(result.data[0])
+        return PersonaRead.from_db_row(result.data[0])
     
-    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Persona]:
-        result = self.client.table(self.table).select("*").range(skip, skip + limit - 1).execute()
-        return [self._to_entity(row) for row in result.data]
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[PersonaRead]:
+        content = await self._get_raw({"select": "*", "offset": skip, "limit": limit})
+        return _PERSONA_LIST_DECODER.decode(content)
     
-    async def update(self, persona_id: str, persona: Persona) -> Optional[Persona]:
-        data = {
-            "nombre": persona.nombre,
-            "apellido": persona.apellido,
-            "email": persona.email,
-            "edad": persona.edad,
-            "telefono": persona.telefono
-        }
-        
-        result = self.client.table(self.table).update(data).eq("id", persona_id).execute()
+    async def update(self, persona_id: str, data: Dict[str, Any]) -> Optional[Persona]:
+        result = await self._run(self.client.table(self.table).update(data).eq("id", persona_id))
         
         if not result.data:
             return None
@@ -275,16 +325,16 @@ class SupabasePersonaRepository(PersonaRepositoryInterface):
         return self._to_entity(result.data[0])
     
     async def delete(self, persona_id: str) -> bool:
-        result = self.client.table(self.table).delete().eq("id", persona_id).execute()
+        result = await self._run(self.client.table(self.table).delete().eq("id", persona_id))
         return len(result.data) > 0
     
-    async def get_by_email(self, email: str) -> Optional[Persona]:
-        result = self.client.table(self.table).select("*").eq("email", email).execute()
+    async def get_by_email(self, email: str) -> Optional[PersonaRead]:
+        result = await self._run(self.client.table(self.table).select("*").eq("email", email))
         
         if not result.data:
             return None
         
-        return self._to_entity(result.data[0])
+        return PersonaRead.from_db_row(result.data[0])
     
     def _to_entity(self, row: dict) -> Persona:
         """Convierte un registro de BD a entidad de dominio"""
@@ -295,86 +345,79 @@ class SupabasePersonaRepository(PersonaRepositoryInterface):
             email=row["email"],
             edad=row["edad"],
             telefono=row.get("telefono"),
-            created_at=datetime.fromisoformat(row["created_at"]) if row.get("created_at") else None,
-            updated_at=datetime.fromisoformat(row["updated_at"]) if row.get("updated_at") else None
+            created_at=row.get("created_at"),
+            updated_at=row.get("updated_at")
         )
 
 
 # ============================================================================
 # 10. INFRASTRUCTURE/API/ROUTES/personas.py - Endpoints FastAPI
 # ============================================================================
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from typing import List
 from src.application.dtos.persona_dto import (
     PersonaCreateDTO, 
     PersonaUpdateDTO, 
-    PersonaResponseDTO
+    PersonaResponseDTO,
+    PERSONA_ENCODER
 )
-from src.application.use_cases.persona.create_persona import CreatePersonaUseCase
-from src.application.use_cases.persona.get_persona import GetPersonaUseCase
-from src.application.use_cases.persona.list_personas import ListPersonasUseCase
-from src.application.use_cases.persona.update_persona import UpdatePersonaUseCase
-from src.application.use_cases.persona.delete_persona import DeletePersonaUseCase
-from src.infrastructure.api.dependencies import get_persona_repository
+from src.infrastructure.api.dependencies import get_persona_use_cases
 
 router = APIRouter(prefix="/personas", tags=["Personas"])
 
 @router.post("/", response_model=PersonaResponseDTO, status_code=201)
 async def create_persona(
     data: PersonaCreateDTO,
-    repository = Depends(get_persona_repository)
+    use_cases = Depends(get_persona_use_cases)
 ):
     """Crear una nueva persona"""
     try:
-        use_case = CreatePersonaUseCase(repository)
-        return await use_case.execute(data)
+        return await use_cases.create.execute(data)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/{persona_id}", response_model=PersonaResponseDTO)
 async def get_persona(
     persona_id: str,
-    repository = Depends(get_persona_repository)
+    use_cases = Depends(get_persona_use_cases)
 ):
     """Obtener una persona por ID"""
     try:
-        use_case = GetPersonaUseCase(repository)
-        return await use_case.execute(persona_id)
+        persona = await use_cases.get.execute(persona_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    return Response(content=PERSONA_ENCODER.encode(persona), media_type="application/json")
 
 @router.get("/", response_model=List[PersonaResponseDTO])
 async def list_personas(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    repository = Depends(get_persona_repository)
+    use_cases = Depends(get_persona_use_cases)
 ):
     """Listar todas las personas con paginación"""
-    use_case = ListPersonasUseCase(repository)
-    return await use_case.execute(skip=skip, limit=limit)
+    personas = await use_cases.list.execute(skip=skip, limit=limit)
+    return Response(content=PERSONA_ENCODER.encode(personas), media_type="application/json")
 
 @router.put("/{persona_id}", response_model=PersonaResponseDTO)
 async def update_persona(
     persona_id: str,
     data: PersonaUpdateDTO,
-    repository = Depends(get_persona_repository)
+    use_cases = Depends(get_persona_use_cases)
 ):
     """Actualizar una persona"""
     try:
-        use_case = UpdatePersonaUseCase(repository)
-        return await use_case.execute(persona_id, data)
+        return await use_cases.update.execute(persona_id, data)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
 @router.delete("/{persona_id}", status_code=204)
 async def delete_persona(
     persona_id: str,
-    repository = Depends(get_persona_repository)
+    use_cases = Depends(get_persona_use_cases)
 ):
     """Eliminar una persona"""
     try:
-        use_case = DeletePersonaUseCase(repository)
-        await use_case.execute(persona_id)
+        await use_cases.delete.execute(persona_id)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -382,19 +425,39 @@ async def delete_persona(
 # ============================================================================
 # 11. INFRASTRUCTURE/API/dependencies.py - Inyección de Dependencias
 # ============================================================================
+from functools import lru_cache
+from types import SimpleNamespace
 from supabase import create_client, Client
 from src.infrastructure.config.settings import get_settings
 from src.infrastructure.database.repositories.supabase_persona_repository import SupabasePersonaRepository
+from src.application.use_cases.persona.create_persona import CreatePersonaUseCase
+from src.application.use_cases.persona.get_persona import GetPersonaUseCase
+from src.application.use_cases.persona.list_personas import ListPersonasUseCase
+from src.application.use_cases.persona.update_persona import UpdatePersonaUseCase
+from src.application.use_cases.persona.delete_persona import DeletePersonaUseCase
 
+@lru_cache(maxsize=1)
 def get_supabase_client() -> Client:
-    """Obtener cliente de Supabase"""
+    """Obtener cliente de Supabase (singleton compartido entre requests)"""
     settings = get_settings()
     return create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
 
+@lru_cache(maxsize=1)
 def get_persona_repository() -> SupabasePersonaRepository:
     """Obtener repositorio de personas"""
-    client = get_supabase_client()
-    return SupabasePersonaRepository(client)
+    return SupabasePersonaRepository(get_supabase_client())
+
+@lru_cache(maxsize=1)
+def get_persona_use_cases() -> SimpleNamespace:
+    """Casos de uso de personas (sin estado, se crean una sola vez)"""
+    repository = get_persona_repository()
+    return SimpleNamespace(
+        create=CreatePersonaUseCase(repository),
+        get=GetPersonaUseCase(repository),
+        list=ListPersonasUseCase(repository),
+        update=UpdatePersonaUseCase(repository),
+        delete=DeletePersonaUseCase(repository)
+    )
 
 
 # ============================================================================
@@ -402,15 +465,18 @@ def get_persona_repository() -> SupabasePersonaRepository:
 # ============================================================================
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from src.infrastructure.config.settings import get_settings
 from src.infrastructure.api.routes import personas
+from src.infrastructure.api.dependencies import get_supabase_client
 
 settings = get_settings()
 
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.API_VERSION,
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    default_response_class=ORJSONResponse
 )
 
 # CORS
@@ -425,6 +491,11 @@ app.add_middleware(
 # Rutas
 app.include_router(personas.router, prefix="/api/v1")
 
+@app.on_event("startup")
+async def warmup_supabase_client():
+    """Crea el cliente de Supabase antes del primer request"""
+    get_supabase_client()
+
 @app.get("/health")
 async def health_check():
     return {"status": "ok", "service": settings.APP_NAME}
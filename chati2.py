@@ -2,7 +2,7 @@
 # 1. CORE/INTERFACES/REPOSITORIES/base_repository.py - Repositorio Genérico
 # ============================================================================
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar
 
 T = TypeVar('T')
 
@@ -13,6 +13,10 @@ class BaseRepositoryInterface(Generic[T], ABC):
     async def create(self, data: Dict[str, Any]) -> T:
         pass
     
+    @abstractmethod
+    async def bulk_create(self, rows: List[Dict[str, Any]]) -> List[T]:
+        pass
+    
     @abstractmethod
     async def get_by_id(self, id: str) -> Optional[T]:
         pass
@@ -26,6 +30,15 @@ class BaseRepositoryInterface(Generic[T], ABC):
     ) -> List[T]:
         pass
     
+    @abstractmethod
+    async def get_page(
+        self,
+        after: Optional[Tuple[str, str]] = None,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[T]:
+        pass
+    
     @abstractmethod
     async def update(self, id: str, data: Dict[str, Any]) -> Optional[T]:
         pass
@@ -42,25 +55,64 @@ class BaseRepositoryInterface(Generic[T], ABC):
 # ============================================================================
 # 2. INFRASTRUCTURE/DATABASE/REPOSITORIES/supabase_generic_repository.py
 # ============================================================================
-from typing import Any, Dict, List, Optional
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
 
 from supabase import Client
 
 from src.core.interfaces.repositories.base_repository import \
     BaseRepositoryInterface
 
+# Operadores de filtro soportados -> método del query builder de postgrest
+_OP_DISPATCH = {
+    "$gt": "gt",
+    "$gte": "gte",
+    "$lt": "lt",
+    "$lte": "lte",
+    "$like": "like",
+    "$ilike": "ilike",
+}
+
 
 class SupabaseGenericRepository(BaseRepositoryInterface[Dict[str, Any]]):
-    """Repositorio genérico para cualquier tabla de Supabase"""
+    """Repositorio genérico para cualquier tabla de Supabase
+
+    El cliente de supabase-py es síncrono: todos los `.execute()` pasan por
+    `_run`, que los ejecuta en el threadpool para no bloquear el event loop.
+    """
     
     def __init__(self, supabase_client: Client, table_name: str):
         self.client = supabase_client
         self.table_name = table_name
     
+    async def _run(self, query):
+        """Ejecuta el query síncrono de supabase-py en el threadpool"""
+        return await asyncio.to_thread(query.execute)
+    
+    def _apply_filters(self, query, filters: Optional[Dict[str, Any]]):
+        """Aplica los filtros (igualdad u operadores como {"$gt": 18}) al query"""
+        if not filters:
+            return query
+        
+        for key, value in filters.items():
+            if isinstance(value, dict):
+                operator, val = next(iter(value.items()))
+                method = _OP_DISPATCH.get(operator)
+                if method:
+                    query = getattr(query, method)(key, val)
+            else:
+                query = query.eq(key, value)
+        return query
+    
     async def insert(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        result = self.client.table(self.table_name).insert(data).execute()
+        result = await self._run(self.client.table(self.table_name).insert(data))
         return result.data[0] if result.data else None
     
+    async def bulk_create(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Insertar varios registros en un solo request"""
+        result = await self._run(self.client.table(self.table_name).insert(rows))
+        return result.data
+    
     async def get_all(
         self, 
         skip: int = 0, 
@@ -68,61 +120,55 @@ class SupabaseGenericRepository(BaseRepositoryInterface[Dict[str, Any]]):
         filters: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
         """Obtener todos con paginación y filtros opcionales"""
-        query = self.client.table(self.table_name).select("*")
-        
-        # Aplicar filtros si existen
-        if filters:
-            for key, value in filters.items():
-                if isinstance(value, dict):
-                    # Soportar operadores: {"$gt": 18}, {"$like": "%juan%"}
-                    operator = list(value.keys())[0]
-                    val = value[operator]
-                    
-                    if operator == "$gt":
-                        query = query.gt(key, val)
-                    elif operator == "$gte":
-                        query = query.gte(key, val)
-                    elif operator == "$lt":
-                        query = query.lt(key, val)
-                    elif operator == "$lte":
-                        query = query.lte(key, val)
-                    elif operator == "$like":
-                        query = query.like(key, val)
-                    elif operator == "$ilike":
-                        query = query.ilike(key, val)
-                else:
-                    query = query.eq(key, value)
+        query = self._apply_filters(self.client.table(self.table_name).select("*"), filters)
         
         # Paginación
-        result = query.range(skip, skip + limit - 1).execute()
+        result = await self._run(query.range(skip, skip + limit - 1))
+        return result.data
+    
+    async def get_page(
+        self,
+        after: Optional[Tuple[str, str]] = None,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Paginación por keyset sobre (created_at, id), sin OFFSET"""
+        query = self._apply_filters(self.client.table(self.table_name).select("*"), filters)
+        
+        if after:
+            created_at, last_id = after
+            query = query.or_(
+                f'created_at.gt."{created_at}",'
+                f'and(created_at.eq."{created_at}",id.gt."{last_id}")'
+            )
+        
+        result = await self._run(query.order("created_at").order("id").limit(limit))
         return result.data
     
     async def update(self, id: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Actualizar un registro"""
-        result = self.client.table(self.table_name).update(data).eq("id", id).execute()
+        result = await self._run(self.client.table(self.table_name).update(data).eq("id", id))
         return result.data[0] if result.data else None
     
     async def delete(self, id: str) -> bool:
         """Eliminar un registro"""
-        result = self.client.table(self.table_name).delete().eq("id", id).execute()
+        result = await self._run(self.client.table(self.table_name).delete().eq("id", id))
         return len(result.data) > 0
     
     async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """Contar registros con filtros opcionales"""
-        query = self.client.table(self.table_name).select("*", count="exact")
-        
-        if filters:
-            for key, value in filters.items():
-                query = query.eq(key, value)
+        # head=True: PostgREST solo devuelve el total, sin filas en el body
+        query = self.client.table(self.table_name).select("id", count="exact", head=True)
+        query = self._apply_filters(query, filters)
         
-        result = query.execute()
+        result = await self._run(query)
         return result.count if hasattr(result, 'count') else 0
 
 
 # ============================================================================
 # 3. APPLICATION/USE_CASES/generic_crud_use_case.py - Casos de Uso Genéricos
 # ============================================================================
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.core.interfaces.repositories.base_repository import \
     BaseRepositoryInterface
@@ -138,6 +184,12 @@ class GenericCRUDUseCase:
         """Crear un nuevo registro"""
         return await self.repository.create(data)
     
+    async def bulk_create(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Crear varios registros en una sola llamada"""
+        if not rows:
+            return []
+        return await self.repository.bulk_create(rows)
+    
     async def get_by_id(self, id: str) -> Optional[Dict[str, Any]]:
         """Obtener por ID"""
         result = await self.repository.get_by_id(id)
@@ -154,50 +206,109 @@ class GenericCRUDUseCase:
         """Listar todos con paginación"""
         return await self.repository.get_all(skip=skip, limit=limit, filters=filters)
     
+    async def get_page(
+        self,
+        after: Optional[Tuple[str, str]] = None,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[Tuple[str, str]]]:
+        """Listar una página por cursor; retorna los registros y el cursor siguiente"""
+        records = await self.repository.get_page(after=after, limit=limit, filters=filters)
+        if len(records) < limit:
+            return records, None
+        
+        last = records[-1]
+        if "created_at" not in last:
+            raise ValueError("La tabla no tiene columna created_at; no admite paginación por cursor")
+        return records, (last["created_at"], str(last["id"]))
+    
     async def update(self, id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Actualizar un registro"""
-        # Verificar que existe
-        existing = await self.repository.get_by_id(id)
-        if not existing:
-            raise ValueError(f"Registro con ID {id} no encontrado")
-        
         result = await self.repository.update(id, data)
+        if not result:
+            raise ValueError(f"Registro con ID {id} no encontrado")
         return result
     
     async def delete(self, id: str) -> bool:
         """Eliminar un registro"""
-        # Verificar que existe
-        existing = await self.repository.get_by_id(id)
-        if not existing:
+        deleted = await self.repository.delete(id)
+        if not deleted:
             raise ValueError(f"Registro con ID {id} no encontrado")
-        
-        return await self.repository.delete(id)
+        return deleted
     
     async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """Contar registros"""
         return await self.repository.count(filters=filters)
 
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 # ============================================================================
 # 4. INFRASTRUCTURE/API/ROUTES/generic_crud.py - Router Genérico
 # ============================================================================
+import base64
+from datetime import datetime
+
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
-from src.application.use_cases.generic_crud_use_case import GenericCRUDUseCase
-from src.infrastructure.api.dependencies import get_generic_repository
+from src.infrastructure.api.dependencies import get_generic_use_case
 
 
 class GenericCreateSchema(BaseModel):
     """Schema genérico para crear"""
     data: Dict[str, Any]
 
+class GenericBulkCreateSchema(BaseModel):
+    """Schema genérico para crear varios registros"""
+    data: List[Dict[str, Any]]
+
 class GenericUpdateSchema(BaseModel):
     """Schema genérico para actualizar"""
     data: Dict[str, Any]
 
+def _parse_filters(filters: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Decodifica el JSON de filtros recibido por query string"""
+    if not filters:
+        return None
+    try:
+        filter_dict = orjson.loads(filters)
+    except orjson.JSONDecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Filtros inválidos: {e}")
+    if not isinstance(filter_dict, dict):
+        raise HTTPException(status_code=400, detail="Los filtros deben ser un objeto JSON")
+    return filter_dict
+
+def _encode_cursor(after: Optional[Tuple[str, str]]) -> Optional[str]:
+    """Serializa el cursor (created_at, id) como string opaco"""
+    if after is None:
+        return None
+    return base64.urlsafe_b64encode(orjson.dumps(after)).decode()
+
+def _decode_cursor(cursor: Optional[str]) -> Optional[Tuple[str, str]]:
+    """Decodifica el cursor recibido por query string"""
+    if not cursor:
+        return None
+    try:
+        valor = orjson.loads(base64.urlsafe_b64decode(cursor))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Cursor inválido")
+    # Debe ser [created_at, id]; comillas o barras invertidas romperían el
+    # filtro or_() de PostgREST
+    if (
+        not isinstance(valor, list)
+        or len(valor) != 2
+        or not all(isinstance(parte, str) and '"' not in parte and "\\" not in parte for parte in valor)
+    ):
+        raise HTTPException(status_code=400, detail="Cursor inválido")
+    created_at, last_id = valor
+    try:
+        datetime.fromisoformat(created_at)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Cursor inválido")
+    return created_at, last_id
+
 def create_generic_router(table_name: str, tag: str = None) -> APIRouter:
     """Factory para crear routers CRUD genéricos"""
     
@@ -209,23 +320,50 @@ def create_generic_router(table_name: str, tag: str = None) -> APIRouter:
     @router.post("/", status_code=201)
     async def create_record(
         schema: GenericCreateSchema,
-        repository = Depends(lambda: get_generic_repository(table_name))
+        use_case = Depends(lambda: get_generic_use_case(table_name))
     ):
         """Crear un nuevo registro"""
         try:
-            use_case = GenericCRUDUseCase(repository)
             return await use_case.create(schema.data)
         except Exception as e:
             raise HTTPException(status_code=400, detail=str(e))
     
+    @router.post("/bulk", status_code=201)
+    async def bulk_create_records(
+        schema: GenericBulkCreateSchema,
+        use_case = Depends(lambda: get_generic_use_case(table_name))
+    ):
+        """Crear varios registros en un solo request"""
+        try:
+            return await use_case.bulk_create(schema.data)
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    @router.get("/page")
+    async def list_records_page(
+        cursor: Optional[str] = Query(None, description="Cursor devuelto por la página anterior"),
+        limit: int = Query(100, ge=1, le=1000),
+        filters: Optional[str] = Query(None, description="JSON string de filtros"),
+        use_case = Depends(lambda: get_generic_use_case(table_name))
+    ):
+        """Listar registros paginando por cursor (keyset)"""
+        try:
+            records, after = await use_case.get_page(
+                after=_decode_cursor(cursor),
+                limit=limit,
+                filters=_parse_filters(filters)
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return {"data": records, "next_cursor": _encode_cursor(after)}
+    
     @router.get("/{record_id}")
     async def get_record(
         record_id: str,
-        repository = Depends(lambda: get_generic_repository(table_name))
+        use_case = Depends(lambda: get_generic_use_case(table_name))
     ):
         """Obtener un registro por ID"""
         try:
-            use_case = GenericCRUDUseCase(repository)
             return await use_case.get_by_id(record_id)
         except ValueError as e:
             raise HTTPException(status_code=404, detail=str(e))
@@ -235,24 +373,21 @@ def create_generic_router(table_name: str, tag: str = None) -> APIRouter:
         skip: int = Query(0, ge=0),
         limit: int = Query(100, ge=1, le=1000),
         filters: Optional[str] = Query(None, description="JSON string de filtros"),
-        repository = Depends(lambda: get_generic_repository(table_name))
+        use_case = Depends(lambda: get_generic_use_case(table_name))
     ):
         """Listar registros con paginación y filtros"""
-        import json
-        filter_dict = json.loads(filters) if filters else None
+        filter_dict = _parse_filters(filters)
         
-        use_case = GenericCRUDUseCase(repository)
         return await use_case.get_all(skip=skip, limit=limit, filters=filter_dict)
     
     @router.put("/{record_id}")
     async def update_record(
         record_id: str,
         schema: GenericUpdateSchema,
-        repository = Depends(lambda: get_generic_repository(table_name))
+        use_case = Depends(lambda: get_generic_use_case(table_name))
     ):
         """Actualizar un registro"""
         try:
-            use_case = GenericCRUDUseCase(repository)
             return await use_case.update(record_id, schema.data)
         except ValueError as e:
             raise HTTPException(status_code=404, detail=str(e))
@@ -260,11 +395,10 @@ def create_generic_router(table_name: str, tag: str = None) -> APIRouter:
     @router.delete("/{record_id}", status_code=204)
     async def delete_record(
         record_id: str,
-        repository = Depends(lambda: get_generic_repository(table_name))
+        use_case = Depends(lambda: get_generic_use_case(table_name))
     ):
         """Eliminar un registro"""
         try:
-            use_case = GenericCRUDUseCase(repository)
             await use_case.delete(record_id)
         except ValueError as e:
             raise HTTPException(status_code=404, detail=str(e))
@@ -272,13 +406,11 @@ def create_generic_router(table_name: str, tag: str = None) -> APIRouter:
     @router.get("/count/total")
     async def count_records(
         filters: Optional[str] = Query(None, description="JSON string de filtros"),
-        repository = Depends(lambda: get_generic_repository(table_name))
+        use_case = Depends(lambda: get_generic_use_case(table_name))
     ):
         """Contar registros"""
-        import json
-        filter_dict = json.loads(filters) if filters else None
+        filter_dict = _parse_filters(filters)
         
-        use_case = GenericCRUDUseCase(repository)
         count = await use_case.count(filters=filter_dict)
         return {"count": count}
     
@@ -288,22 +420,31 @@ def create_generic_router(table_name: str, tag: str = None) -> APIRouter:
 # ============================================================================
 # 5. INFRASTRUCTURE/API/dependencies.py - Inyección de Dependencias
 # ============================================================================
+from functools import lru_cache
+
 from supabase import Client, create_client
 
 from src.infrastructure.config.settings import get_settings
+from src.application.use_cases.generic_crud_use_case import GenericCRUDUseCase
 from src.infrastructure.database.repositories.supabase_generic_repository import \
     SupabaseGenericRepository
 
 
+@lru_cache(maxsize=1)
 def get_supabase_client() -> Client:
-    """Obtener cliente de Supabase"""
+    """Obtener cliente de Supabase (singleton compartido entre requests)"""
     settings = get_settings()
     return create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
 
+@lru_cache(maxsize=None)
 def get_generic_repository(table_name: str) -> SupabaseGenericRepository:
     """Obtener repositorio genérico para una tabla"""
-    client = get_supabase_client()
-    return SupabaseGenericRepository(client, table_name)
+    return SupabaseGenericRepository(get_supabase_client(), table_name)
+
+@lru_cache(maxsize=None)
+def get_generic_use_case(table_name: str) -> GenericCRUDUseCase:
+    """Obtener casos de uso CRUD para una tabla (uno por tabla)"""
+    return GenericCRUDUseCase(get_generic_repository(table_name))
 
 
 # ============================================================================
@@ -311,7 +452,9 @@ def get_generic_repository(table_name: str) -> SupabaseGenericRepository:
 # ============================================================================
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from src.infrastructure.api.dependencies import get_supabase_client
 from src.infrastructure.api.routes.generic_crud import create_generic_router
 from src.infrastructure.config.settings import get_settings
 
@@ -320,7 +463,8 @@ settings = get_settings()
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.API_VERSION,
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    default_response_class=ORJSONResponse
 )
 
 # CORS
@@ -342,6 +486,11 @@ app.include_router(personas_router, prefix="/api/v1")
 app.include_router(productos_router, prefix="/api/v1")
 app.include_router(clientes_router, prefix="/api/v1")
 
+@app.on_event("startup")
+async def warmup_supabase_client():
+    """Crea el cliente de Supabase antes del primer request"""
+    get_supabase_client()
+
 @app.get("/health")
 async def health_check():
     return {"status": "ok", "service": settings.APP_NAME}
@@ -363,9 +512,22 @@ POST /api/v1/personas
   }
 }
 
+CREAR VARIAS PERSONAS (un solo insert):
+POST /api/v1/personas/bulk
+{
+  "data": [
+    {"nombre": "Juan", "apellido": "Pérez", "email": "juan@example.com", "edad": 30},
+    {"nombre": "Ana", "apellido": "Gómez", "email": "ana@example.com", "edad": 25}
+  ]
+}
+
 LISTAR CON FILTROS:
 GET /api/v1/personas?skip=0&limit=10&filters={"edad": {"$gt": 25}}
 
+LISTAR POR CURSOR (sin OFFSET; usar next_cursor de la respuesta anterior):
+GET /api/v1/personas/page?limit=10
+GET /api/v1/personas/page?limit=10&cursor={next_cursor}
+
 OBTENER POR ID:
 GET /api/v1/personas/{id}
 
@@ -390,29 +552,31 @@ GET /api/v1/personas/count/total?filters={"edad": {"$gt": 18}}
 # 7. ALTERNATIVA: Router único dinámico
 # ============================================================================
 from fastapi import Path
+from fastapi.responses import ORJSONResponse
 
 # Si prefieres un único endpoint que reciba la tabla como parámetro:
+# get_generic_use_case recibe `table_name` del path y está cacheado por tabla,
+# así que cada request reutiliza el mismo repositorio y caso de uso.
 dynamic_router = APIRouter(prefix="/api/v1/crud", tags=["CRUD Dinámico"])
 
-@dynamic_router.post("/{table_name}/")
+# Las filas vienen de Supabase: se devuelven tal cual, sin validar la respuesta
+@dynamic_router.post("/{table_name}/", response_model=None)
 async def dynamic_create(
     table_name: str = Path(..., description="Nombre de la tabla"),
     schema: GenericCreateSchema = None,
-    repository = Depends(lambda table_name: get_generic_repository(table_name))
+    use_case = Depends(get_generic_use_case)
 ):
     """Crear registro en cualquier tabla"""
-    use_case = GenericCRUDUseCase(repository)
-    return await use_case.create(schema.data)
+    return ORJSONResponse(await use_case.create(schema.data))
 
-@dynamic_router.get("/{table_name}/{record_id}")
+@dynamic_router.get("/{table_name}/{record_id}", response_model=None)
 async def dynamic_get(
     table_name: str,
     record_id: str,
-    repository = Depends(lambda table_name: get_generic_repository(table_name))
+    use_case = Depends(get_generic_use_case)
 ):
     """Obtener registro de cualquier tabla"""
-    use_case = GenericCRUDUseCase(repository)
-    return await use_case.get_by_id(record_id)
+    return ORJSONResponse(await use_case.get_by_id(record_id))
 
 # app.include_router(dynamic_router)
 
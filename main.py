@@ -1,13 +1,20 @@
+import sys
+
 import uvicorn
 from src.configs.settings import get_settings
 
 if __name__ == "__main__":
     settings = get_settings()
+    recargar = settings.DEBUG or settings.RELOAD
     
     uvicorn.run(
         "src.api.index:app",
         host=settings.HOST,
         port=settings.PORT,
-        reload=settings.DEBUG,  # Auto-reload en desarrollo
-        log_level="info"
+        reload=recargar,  # Auto-reload en desarrollo
+        workers=1 if recargar else settings.WORKERS,  # reload no admite varios workers
+        log_level="info",
+        # uvloop no soporta Windows; ahí se usa el loop estándar de asyncio
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
     )
\ No newline at end of file
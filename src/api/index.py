@@ -1,8 +1,55 @@
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.requests import Request
+from starlette.responses import Response
+from src.configs.settings import get_settings
+from src.infraestructura.config.supabase import get_supabase_rest_client
 from src.infraestructura.routes.api import router as api_router
+from src.shell.flujo.prueba.conexion_supabase import verificar_autenticacion_supabase
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Se construyen settings y esquemas (validadores/serializadores de Pydantic)
+    # al arrancar, para que el primer request no pague ese costo
+    settings = get_settings()
+    app.openapi()
+
+    # Se abre una sola vez el pool de conexiones HTTP hacia Supabase
+    app.state.supabase = get_supabase_rest_client()
+
+    # Diagnóstico de autenticación: solo en desarrollo y una única vez
+    app.state.supabase_auth_ok = await verificar_autenticacion_supabase() if settings.DEBUG else None
+    yield
+    await app.state.supabase.aclose()
+    get_supabase_rest_client.cache_clear()
+
+
+# Respuesta de /health construida una sola vez al importar
+_HEALTH = Response(b'{"status":"ok"}', media_type="application/json")
+
+
+async def health(request: Request) -> Response:
+    # Ruta Starlette pura: sin resolución de dependencias ni serialización
+    return _HEALTH
+
+
+def create_app() -> FastAPI:
+    """Construye la aplicación con todas sus rutas (se llama una sola vez)"""
+    app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+    # Compresión de respuestas grandes; nivel 5 para no cargar el event loop
+    app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
+
+    # Se incluyen las rutas
+    app.add_route("/health", health, methods=["GET"], include_in_schema=False)
+    app.include_router(api_router)
+
+    return app
 
-app = FastAPI()
 
-# Se incluyen las rutas
-app.include_router(api_router)
\ No newline at end of file
+app = create_app()
\ No newline at end of file
@@ -1,3 +1,4 @@
+import os
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 
@@ -5,6 +6,9 @@ class Settings(BaseSettings):
     # Supabase
     SUPABASE_URL: str
     SUPABASE_KEY: str
+    # Pool de conexiones HTTP hacia PostgREST (por worker)
+    SUPABASE_MAX_CONNECTIONS: int = 20
+    SUPABASE_MAX_KEEPALIVE: int = 10
     
     # App
     APP_NAME: str = "FastAPI Functional"
@@ -17,6 +21,8 @@ class Settings(BaseSettings):
     # Server
     HOST: str = "0.0.0.0"
     PORT: int = 8000
+    WORKERS: int = max(1, (os.cpu_count() or 1) * 2 + 1)
+    RELOAD: bool = False
     
     class Config:
         env_file = ".env"
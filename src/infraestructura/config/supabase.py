@@ -1,3 +1,4 @@
+import httpx
 from supabase import create_client, Client
 from functools import lru_cache
 from src.configs.settings import get_settings
@@ -6,4 +7,22 @@ from src.configs.settings import get_settings
 def get_supabase_client() -> Client:
     """Retorna cliente de Supabase (singleton)"""
     settings = get_settings()
-    return create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
\ No newline at end of file
+    return create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
+
+@lru_cache()
+def get_supabase_rest_client() -> httpx.AsyncClient:
+    """Retorna cliente HTTP asíncrono para la API REST de Supabase (singleton)"""
+    settings = get_settings()
+    return httpx.AsyncClient(
+        base_url=f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1",
+        headers={
+            "apikey": settings.SUPABASE_KEY,
+            "Authorization": f"Bearer {settings.SUPABASE_KEY}",
+        },
+        limits=httpx.Limits(
+            max_connections=settings.SUPABASE_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.SUPABASE_MAX_KEEPALIVE,
+        ),
+        timeout=httpx.Timeout(connect=2.0, read=10.0, write=10.0, pool=5.0),
+        http2=True,
+    )
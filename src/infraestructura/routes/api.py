@@ -1,13 +1,19 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Request
 
+from src.configs.settings import get_settings
 from src.shell.adaptadores.externals.openmeteo import obtenerInformacionClimatica
 from src.shell.flujo.prueba.conexion_supabase import conexion_supabase
 
 router = APIRouter()
 
-@router.get("/health")
-async def root():
-    result = await conexion_supabase(True)
+@router.get("/diagnostics", include_in_schema=False)
+async def diagnostico(request: Request):
+    # Pruebas de conexión contra Supabase, solo disponibles en desarrollo
+    if not get_settings().DEBUG:
+        raise HTTPException(status_code=404)
+    result = await conexion_supabase()
+    # La autenticación se verifica una sola vez al arrancar (ver lifespan)
+    result["autenticacion_exitosa"] = getattr(request.app.state, "supabase_auth_ok", None)
     return {"message": result} 
 
 @router.get("/weather")
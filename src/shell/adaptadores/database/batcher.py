@@ -0,0 +1,70 @@
+import asyncio
+from typing import Optional
+
+from src.infraestructura.config.supabase import get_supabase_rest_client
+
+
+def _lista_in(claves: list[str]) -> str:
+    """Arma el filtro `in.(...)` de PostgREST con cada id entre comillas"""
+    valores = ",".join(
+        '"' + clave.replace("\\", "\\\\").replace('"', '\\"') + '"' for clave in claves
+    )
+    return f"in.({valores})"
+
+
+class IdLoader:
+    """Agrupa las lecturas por id de una tabla en un solo request a PostgREST.
+
+    Todas las llamadas a `load` hechas en la misma vuelta del event loop
+    (por ejemplo dentro de un `asyncio.gather`) se resuelven con un único
+    `GET /{table}?id=in.(...)`. Se crea una instancia por request: los
+    resultados quedan cacheados mientras viva el loader.
+    """
+
+    def __init__(self, table: str):
+        self.table = table
+        self._cache: dict[str, asyncio.Future] = {}
+        self._pendientes: list[str] = []
+        self._tareas: set[asyncio.Task] = set()
+
+    async def load(self, id: str) -> Optional[dict]:
+        clave = str(id)
+        futuro = self._cache.get(clave)
+        if futuro is None:
+            loop = asyncio.get_running_loop()
+            futuro = self._cache[clave] = loop.create_future()
+            if not self._pendientes:
+                loop.call_soon(self._despachar)
+            self._pendientes.append(clave)
+        # shield: si este llamador se cancela, el futuro compartido sigue vivo
+        # para los demás que esperan el mismo id
+        return await asyncio.shield(futuro)
+
+    def _despachar(self) -> None:
+        lote, self._pendientes = self._pendientes, []
+        tarea = asyncio.get_running_loop().create_task(self._ejecutar(lote))
+        # Referencia fuerte hasta que termine, para que no la recolecte el GC
+        self._tareas.add(tarea)
+        tarea.add_done_callback(self._tareas.discard)
+
+    async def _ejecutar(self, lote: list[str]) -> None:
+        try:
+            client = get_supabase_rest_client()
+            response = await client.get(
+                f"/{self.table}",
+                params={"select": "*", "id": _lista_in(lote)},
+            )
+            response.raise_for_status()
+            por_id = {str(registro["id"]): registro for registro in response.json()}
+        except Exception as e:
+            for clave in lote:
+                futuro = self._cache.pop(clave)
+                if not futuro.done():
+                    futuro.set_exception(e)
+            return
+
+        for clave in lote:
+            futuro = self._cache[clave]
+            if not futuro.done():
+                futuro.set_result(por_id.get(clave))
+
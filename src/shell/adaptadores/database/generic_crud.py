@@ -1,20 +1,93 @@
-from src.infraestructura.config.supabase import get_supabase_client
+from src.infraestructura.config.supabase import get_supabase_rest_client
 from typing import TypeVar, Generic, Optional, Any
-from datetime import datetime
+from datetime import datetime, timezone
+import httpx
+import time
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 
 T = TypeVar('T')
 
+# Cliente REST resuelto una vez y reutilizado por todas las funciones CRUD
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+def _client() -> httpx.AsyncClient:
+    global _CLIENT
+    # Se vuelve a pedir si el lifespan de la app lo cerró al apagarse
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = get_supabase_rest_client()
+    return _CLIENT
+
+# PostgREST solo devuelve las filas afectadas si se pide explícitamente
+RETORNAR_FILAS = {"Prefer": "return=representation"}
+
+# Timestamp ISO cacheado por segundo: se regenera solo cuando cambia el segundo
+_ultimo_segundo = -1
+_ultimo_iso = ""
+
+def _ahora_iso() -> str:
+    """Fecha/hora actual en UTC (ISO 8601), con resolución de un segundo"""
+    global _ultimo_segundo, _ultimo_iso
+    segundo = int(time.time())
+    if segundo != _ultimo_segundo:
+        _ultimo_iso = datetime.fromtimestamp(segundo, timezone.utc).isoformat()
+        _ultimo_segundo = segundo
+    return _ultimo_iso
+
+# Errores de PostgREST que se devuelven tal cual al cliente; el resto es un 502
+ERRORES_PROPAGADOS = {400, 404, 409}
+
+def _verificar(response: httpx.Response) -> None:
+    """Convierte una respuesta de error de PostgREST en HTTPException"""
+    if not response.is_error:
+        return
+    if response.status_code not in ERRORES_PROPAGADOS:
+        raise HTTPException(status_code=502, detail="Error al consultar Supabase")
+    try:
+        cuerpo = response.json()
+    except ValueError:
+        cuerpo = None
+    detalle = cuerpo.get("message") if isinstance(cuerpo, dict) else None
+    raise HTTPException(status_code=response.status_code, detail=detalle or response.reason_phrase)
+
+def _filtros_eq(filters: Optional[dict]) -> dict:
+    """Convierte {campo: valor} al formato de filtros de PostgREST (campo=eq.valor)"""
+    return {field: f"eq.{value}" for field, value in (filters or {}).items()}
+
+
 async def insert(table: str, data: dict) -> dict:
-    client= get_supabase_client()
+    client = _client()
     if "fecha_creado" not in data:
-        data["fecha_creado"] = datetime.utcnow().isoformat()
+        data["fecha_creado"] = _ahora_iso()
     
-    response = client.table(table).insert(data).execute()
+    response = await client.post(f"/{table}", json=data, headers=RETORNAR_FILAS)
+    _verificar(response)
+    registros = response.json()
     
-    if not response.data:
-        raise Exception(f"Error al insertar en {table}")
+    if not registros:
+        raise HTTPException(status_code=500, detail=f"Error al insertar en {table}")
     
-    return response.data[0]
+    return registros[0]
+
+
+def _params_get(
+    filters: Optional[dict],
+    limit: int,
+    offset: int,
+    order_by: str,
+    order_desc: bool
+) -> dict:
+    return {
+        "select": "*",
+        # Ordenamiento
+        "order": f"{order_by}.{'desc' if order_desc else 'asc'}",
+        # Paginación
+        "limit": limit,
+        "offset": offset,
+        # Aplicar filtros
+        **_filtros_eq(filters),
+    }
 
 
 async def get(
@@ -25,51 +98,79 @@ async def get(
     order_by: str = "id",
     order_desc: bool = True
 ) -> list[dict]:
-    client = get_supabase_client()
+    client = _client()
     
-    query = client.table(table).select("*")
+    params = _params_get(filters, limit, offset, order_by, order_desc)
     
-    # Aplicar filtros
-    if filters:
-        for field, value in filters.items():
-            query = query.eq(field, value)
+    response = await client.get(f"/{table}", params=params)
+    _verificar(response)
     
-    # Ordenamiento
-    query = query.order(order_by, desc=order_desc)
+    return response.json()
+
+
+async def get_stream(
+    table: str,
+    filters: Optional[dict] = None,
+    limit: int = 100,
+    offset: int = 0,
+    order_by: str = "id",
+    order_desc: bool = True
+) -> StreamingResponse:
+    """Igual que `get`, pero reenvía el JSON de PostgREST por partes, sin parsearlo.
+
+    El estado de PostgREST se verifica antes de devolver la respuesta, así un
+    error llega como HTTPException y no después de enviar el 200.
+    """
+    client = _client()
+    
+    params = _params_get(filters, limit, offset, order_by, order_desc)
     
-    # Paginación
-    response = query.range(offset, offset + limit - 1).execute()
+    request = client.build_request("GET", f"/{table}", params=params)
+    response = await client.send(request, stream=True)
+    if response.is_error:
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+        _verificar(response)
     
-    return response.data
+    # La conexión se libera cuando termina de enviarse el cuerpo
+    return StreamingResponse(
+        response.aiter_bytes(),
+        media_type="application/json",
+        background=BackgroundTask(response.aclose),
+    )
 
 
 async def update(table: str, id: str, updates: dict) -> dict:
-    client = get_supabase_client()
+    client = _client()
     
     # Agregar timestamp de actualización
-    updates["fecha_edit"] = datetime.utcnow().isoformat()
+    updates["fecha_edit"] = _ahora_iso()
     
-    response = client.table(table).update(updates).eq("id", id).execute()
+    response = await client.patch(
+        f"/{table}",
+        params={"id": f"eq.{id}"},
+        json=updates,
+        headers=RETORNAR_FILAS,
+    )
+    _verificar(response)
+    registros = response.json()
     
-    if not response.data:
-        raise Exception(f"No se encontró registro con id {id} en {table}")
+    if not registros:
+        raise HTTPException(status_code=404, detail=f"No se encontró registro con id {id} en {table}")
     
-    return response.data[0]
+    return registros[0]
 
 async def soft_delete(table: str, id: str) -> dict:
-    return await update(table, id, {
-        "fecha_edit": datetime.utcnow().isoformat(),
-        "estado": 'inactivo'
-    })
+    # `update` ya agrega fecha_edit
+    return await update(table, id, {"estado": 'inactivo'})
 
 async def count(table: str, filters: Optional[dict] = None) -> int:
-    client = get_supabase_client()
-    
-    query = client.table(table).select("*", count="exact")
-    
-    if filters:
-        for field, value in filters.items():
-            query = query.eq(field, value)
+    client = _client()
     
-    response = query.execute()
-    return response.count
+    # HEAD: PostgREST responde solo con el header Content-Range, sin filas
+    response = await client.head(f"/{table}", params=_filtros_eq(filters), headers={"Prefer": "count=exact"})
+    _verificar(response)
+    # Content-Range: 0-24/25 (o */0 si no hay filas)
+    return int(response.headers["content-range"].split("/")[-1])
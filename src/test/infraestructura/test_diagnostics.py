@@ -0,0 +1,23 @@
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+from src.api.index import app
+from src.infraestructura.routes import api
+
+tester = TestClient(app)
+
+def test_oculto_fuera_de_debug(monkeypatch):
+    monkeypatch.setattr(api, "get_settings", lambda: SimpleNamespace(DEBUG=False))
+    response = tester.get("/diagnostics")
+    assert response.status_code == 404
+
+def test_disponible_en_debug(monkeypatch):
+    async def conexion_falsa():
+        return {"conexion_exitosa": True}
+
+    monkeypatch.setattr(api, "get_settings", lambda: SimpleNamespace(DEBUG=True))
+    monkeypatch.setattr(api, "conexion_supabase", conexion_falsa)
+    response = tester.get("/diagnostics")
+    assert response.status_code == 200
+    # Sin lifespan no hay verificación de autenticación en app.state
+    assert response.json() == {"message": {"conexion_exitosa": True, "autenticacion_exitosa": None}}
@@ -0,0 +1,86 @@
+import asyncio
+
+import httpx
+
+from src.shell.adaptadores.database import batcher
+from src.shell.adaptadores.database.batcher import IdLoader
+
+
+def _cliente(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="http://supabase.test/rest/v1")
+
+
+def test_agrupa_ids_en_un_solo_request(monkeypatch):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=[{"id": 1, "nombre": "a"}, {"id": 2, "nombre": "b"}])
+
+    monkeypatch.setattr(batcher, "get_supabase_rest_client", lambda: _cliente(handler))
+
+    async def main():
+        loader = IdLoader("demo")
+        return await asyncio.gather(loader.load("1"), loader.load(2), loader.load("1"), loader.load("9"))
+
+    resultado = asyncio.run(main())
+
+    assert len(requests) == 1
+    assert requests[0].url.path == "/rest/v1/demo"
+    assert requests[0].url.params["id"] == 'in.("1","2","9")'
+    assert resultado == [{"id": 1, "nombre": "a"}, {"id": 2, "nombre": "b"}, {"id": 1, "nombre": "a"}, None]
+
+
+def test_escapa_ids_con_caracteres_especiales(monkeypatch):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=[])
+
+    monkeypatch.setattr(batcher, "get_supabase_rest_client", lambda: _cliente(handler))
+
+    asyncio.run(IdLoader("demo").load('a,b"(c)'))
+
+    assert requests[0].url.params["id"] == 'in.("a,b\\"(c)")'
+
+
+def test_propaga_errores_a_todos_los_llamadores(monkeypatch):
+    monkeypatch.setattr(batcher, "get_supabase_rest_client", lambda: _cliente(lambda request: httpx.Response(500)))
+
+    async def main():
+        loader = IdLoader("demo")
+        return await asyncio.gather(loader.load("1"), loader.load("2"), return_exceptions=True)
+
+    resultado = asyncio.run(main())
+
+    assert all(isinstance(r, httpx.HTTPStatusError) for r in resultado)
+
+
+def test_cancelar_un_llamador_no_afecta_a_los_demas(monkeypatch):
+    async def main():
+        liberar = asyncio.Event()
+
+        async def handler(request):
+            await liberar.wait()
+            return httpx.Response(200, json=[{"id": "1"}, {"id": "2"}])
+
+        monkeypatch.setattr(batcher, "get_supabase_rest_client", lambda: _cliente(handler))
+        loader = IdLoader("demo")
+        cancelado = asyncio.create_task(loader.load("1"))
+        mismo_id = asyncio.create_task(loader.load("1"))
+        otro_id = asyncio.create_task(loader.load("2"))
+
+        # Esperar a que el lote esté en vuelo antes de cancelar
+        for _ in range(5):
+            await asyncio.sleep(0)
+        cancelado.cancel()
+        liberar.set()
+
+        resultado = await asyncio.wait_for(asyncio.gather(mismo_id, otro_id), timeout=1)
+        return cancelado, resultado
+
+    cancelado, resultado = asyncio.run(main())
+
+    assert cancelado.cancelled()
+    assert resultado == [{"id": "1"}, {"id": "2"}]
@@ -0,0 +1,159 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from src.shell.adaptadores.database import generic_crud
+
+
+@pytest.fixture
+def postgrest(monkeypatch):
+    """Reemplaza el cliente REST por uno con MockTransport y guarda los requests"""
+    requests = []
+    respuestas = []
+
+    def handler(request):
+        requests.append(request)
+        return respuestas.pop(0)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="http://supabase.test/rest/v1")
+    monkeypatch.setattr(generic_crud, "_CLIENT", client)
+    return requests, respuestas
+
+
+def test_insert_pide_representacion_y_devuelve_la_fila(postgrest):
+    requests, respuestas = postgrest
+    respuestas.append(httpx.Response(201, json=[{"id": 1, "nombre": "a"}]))
+
+    registro = asyncio.run(generic_crud.insert("demo", {"nombre": "a"}))
+
+    assert registro == {"id": 1, "nombre": "a"}
+    request = requests[0]
+    assert request.method == "POST"
+    assert request.url.path == "/rest/v1/demo"
+    assert request.headers["prefer"] == "return=representation"
+    body = json.loads(request.content)
+    assert body["nombre"] == "a"
+    assert "fecha_creado" in body
+
+
+def test_insert_sin_filas_es_error(postgrest):
+    _, respuestas = postgrest
+    respuestas.append(httpx.Response(201, json=[]))
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(generic_crud.insert("demo", {"nombre": "a"}))
+    assert error.value.status_code == 500
+
+
+def test_get_arma_orden_paginacion_y_filtros(postgrest):
+    requests, respuestas = postgrest
+    respuestas.append(httpx.Response(200, json=[{"id": 2}, {"id": 1}]))
+
+    registros = asyncio.run(
+        generic_crud.get("demo", filters={"estado": "activo"}, limit=10, offset=20, order_by="nombre", order_desc=False)
+    )
+
+    assert registros == [{"id": 2}, {"id": 1}]
+    params = requests[0].url.params
+    assert params["select"] == "*"
+    assert params["order"] == "nombre.asc"
+    assert params["limit"] == "10"
+    assert params["offset"] == "20"
+    assert params["estado"] == "eq.activo"
+
+
+def test_update_filtra_por_id_y_agrega_fecha_edit(postgrest):
+    requests, respuestas = postgrest
+    respuestas.append(httpx.Response(200, json=[{"id": 7, "nombre": "b"}]))
+
+    registro = asyncio.run(generic_crud.update("demo", "7", {"nombre": "b"}))
+
+    assert registro == {"id": 7, "nombre": "b"}
+    request = requests[0]
+    assert request.method == "PATCH"
+    assert request.url.params["id"] == "eq.7"
+    assert request.headers["prefer"] == "return=representation"
+    assert "fecha_edit" in json.loads(request.content)
+
+
+def test_update_sin_filas_es_404(postgrest):
+    _, respuestas = postgrest
+    respuestas.append(httpx.Response(200, json=[]))
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(generic_crud.update("demo", "7", {"nombre": "b"}))
+    assert error.value.status_code == 404
+
+
+@pytest.mark.parametrize("content_range, esperado", [("0-24/25", 25), ("*/0", 0)])
+def test_count_lee_el_total_de_content_range(postgrest, content_range, esperado):
+    requests, respuestas = postgrest
+    respuestas.append(httpx.Response(200, headers={"Content-Range": content_range}))
+
+    total = asyncio.run(generic_crud.count("demo", {"estado": "activo"}))
+
+    assert total == esperado
+    request = requests[0]
+    assert request.method == "HEAD"
+    assert request.url.params["estado"] == "eq.activo"
+    assert request.headers["prefer"] == "count=exact"
+
+
+def test_errores_del_cliente_se_propagan_con_el_mensaje_de_postgrest(postgrest):
+    _, respuestas = postgrest
+    respuestas.append(httpx.Response(409, json={"code": "23505", "message": "duplicate key value"}))
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(generic_crud.insert("demo", {"nombre": "a"}))
+    assert error.value.status_code == 409
+    assert error.value.detail == "duplicate key value"
+
+
+def test_errores_del_servidor_son_502(postgrest):
+    _, respuestas = postgrest
+    respuestas.append(httpx.Response(500, json={"message": "boom"}))
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(generic_crud.get("demo"))
+    assert error.value.status_code == 502
+
+
+def test_count_sin_cuerpo_usa_el_motivo_http(postgrest):
+    _, respuestas = postgrest
+    respuestas.append(httpx.Response(404))
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(generic_crud.count("no_existe"))
+    assert error.value.status_code == 404
+    assert error.value.detail == "Not Found"
+
+
+def test_get_stream_reenvia_el_cuerpo_sin_parsearlo(postgrest):
+    requests, respuestas = postgrest
+    respuestas.append(httpx.Response(200, content=b'[{"id":1}]'))
+
+    async def main():
+        response = await generic_crud.get_stream("demo", limit=5)
+        cuerpo = b"".join([parte async for parte in response.body_iterator])
+        await response.background()
+        return response, cuerpo
+
+    response, cuerpo = asyncio.run(main())
+
+    assert response.status_code == 200
+    assert response.media_type == "application/json"
+    assert cuerpo == b'[{"id":1}]'
+    assert requests[0].url.params["limit"] == "5"
+
+
+def test_get_stream_falla_antes_de_empezar_a_enviar(postgrest):
+    _, respuestas = postgrest
+    respuestas.append(httpx.Response(404, json={"message": "relation does not exist"}))
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(generic_crud.get_stream("no_existe"))
+    assert error.value.status_code == 404
+    assert error.value.detail == "relation does not exist"